@@ -9,10 +9,12 @@ Copyright 2024 OMVA Team
 Licensed under the Apache License, Version 2.0
 """
 
+import os
 import re
-import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from ovos_bus_client.message import Message
 from ovos_utils.log import LOG
@@ -22,10 +24,239 @@ from ovos_workshop.skills import OVOSSkill
 
 try:
     # Try relative import first (when used as a package)
-    from .constants import SAMPLE_PHRASES, EnrollmentState, ErrorCodes, MessageBusEvents
+    from .constants import (
+        DEFAULT_INTER_SAMPLE_PAUSE,
+        SAMPLE_PHRASES,
+        EnrollmentState,
+        EnrollmentTimeouts,
+        ErrorCodes,
+        MessageBusEvents,
+    )
+    from .enrollment_context import EnrollmentContext
 except ImportError:
     # Fall back to absolute import (when run directly or in tests)
-    from constants import SAMPLE_PHRASES, EnrollmentState, ErrorCodes, MessageBusEvents
+    from constants import (
+        DEFAULT_INTER_SAMPLE_PAUSE,
+        SAMPLE_PHRASES,
+        EnrollmentState,
+        EnrollmentTimeouts,
+        ErrorCodes,
+        MessageBusEvents,
+    )
+    from enrollment_context import EnrollmentContext
+
+_SAMPLE_PHRASE_COUNT = len(SAMPLE_PHRASES)
+
+# Dialog spoken for each enrollment failure code (read-only)
+_ERROR_DIALOGS = MappingProxyType(
+    {
+        ErrorCodes.AUDIO_QUALITY_POOR: "error_audio_quality",
+        ErrorCodes.PROCESSING_FAILED: "error_processing_failed",
+        ErrorCodes.NETWORK_ERROR: "error_network",
+        ErrorCodes.PLUGIN_UNAVAILABLE: "error_plugin_unavailable",
+        ErrorCodes.USER_EXISTS: "error_user_exists",
+    }
+)
+
+# Plugin error messages mapped to our error codes, scanned as one alternation
+# (anything unmatched is PROCESSING_FAILED)
+_PLUGIN_ERROR_MESSAGES = (
+    (ErrorCodes.INVALID_NAME, ("User ID is required", "missing user_name")),
+    (
+        ErrorCodes.SAMPLE_COUNT_INSUFFICIENT,
+        ("Audio samples are required", "No valid audio samples"),
+    ),
+    (ErrorCodes.PLUGIN_UNAVAILABLE, ("Voice processor not initialized",)),
+)
+# One positional group per error code, so match.lastindex - 1 indexes the codes
+# and error code values need not be valid group names
+_PLUGIN_ERROR_RE = re.compile(
+    "|".join(
+        f"({'|'.join(map(re.escape, needles))})"
+        for _, needles in _PLUGIN_ERROR_MESSAGES
+    )
+)
+_PLUGIN_ERROR_CODES = tuple(code for code, _ in _PLUGIN_ERROR_MESSAGES)
+
+# Shared name subpatterns: an optional supported title, then 3-50 name characters
+_TITLE_FRAGMENT = r"(?:Dr\.?\s+|Mr\.?\s+|Ms\.?\s+|Mrs\.?\s+|Miss\s+)?"
+_NAME_BODY_FRAGMENT = r"[a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z]"
+_NAME_FRAGMENT = _TITLE_FRAGMENT + _NAME_BODY_FRAGMENT
+
+# Precompiled name extraction patterns (compiled once at import, not per utterance)
+# Starters are one anchored alternation so a single match attempt covers all of
+# them; multi-word starters come first since re picks the leftmost branch.
+_NAME_STARTERS_RE = re.compile(
+    r"^(?:my name is|the name is|call me|i\'?m|it\'?s|use)\s+", re.IGNORECASE
+)
+# Order matters: "as NAME" is tried before "name NAME" ("put my name down as
+# Jack" is Jack), and the bare-name pattern only when neither keyword matches,
+# otherwise it would swallow whole phrases such as "enroll me as Alice"
+_AS_NAME_RE = re.compile(rf"\bas\s+({_NAME_FRAGMENT})", re.IGNORECASE)
+_NAME_KEYWORD_RE = re.compile(rf"\bname\s+({_NAME_FRAGMENT})", re.IGNORECASE)
+_BARE_NAME_RE = re.compile(rf"^({_NAME_FRAGMENT})$", re.IGNORECASE)
+# Hardcoded English keywords, tried in priority order: "I'm enrolling for Bob"
+# must yield Bob from "for", not the text after the earlier "I'm"
+_FALLBACK_NAME_PATTERNS = tuple(
+    re.compile(rf"\b{keyword}\s+({_NAME_FRAGMENT})\b", re.IGNORECASE)
+    for keyword in (
+        "as",
+        "for",
+        r"my\s+name\s+is",
+        r"(?:i\'?m|i\s+am)",
+        r"call\s+me",
+    )
+)
+
+
+def _alternation(words: Iterable[str]) -> str:
+    """Join literal words into a regex alternation body
+
+    Reverse-sorted so words sharing a prefix sit together and the longer one
+    ("mother in law") is tried before its prefix ("mother").
+    """
+    return "|".join(re.escape(word) for word in sorted(words, reverse=True))
+
+
+def _phrase_re(phrases: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile whole-word phrases into one case-insensitive alternation"""
+    return re.compile(
+        r"\b(?:" + "|".join(map(re.escape, phrases)) + r")\b", re.IGNORECASE
+    )
+
+
+# Restart/abort phrases shared by name collection and the session-wide converse
+# check; word boundaries keep "stop" from firing inside a name like "Christopher"
+_RESTART_PHRASES = (
+    "restart",
+    "start over",
+    "start again",
+    "begin again",
+    "restart enrollment",
+    "change name",
+    "different name",
+    "wrong name",
+    "use different name",
+    "that's wrong",
+    "that's not right",
+    "not that name",
+)
+_ABORT_PHRASES = (
+    "cancel",
+    "stop",
+    "abort",
+    "quit",
+    "exit",
+    "nevermind",
+    "never mind",
+    "forget it",
+    "not now",
+)
+_NAME_RESTART_RE = _phrase_re(_RESTART_PHRASES)
+_NAME_ABORT_RE = _phrase_re(_ABORT_PHRASES + ("no thanks", "i changed my mind"))
+_SESSION_RESTART_RE = _phrase_re(
+    _RESTART_PHRASES
+    + ("enroll as", "i want to restart", "let me restart", "can i restart")
+)
+_SESSION_ABORT_RE = _phrase_re(
+    _ABORT_PHRASES + ("end this", "stop enrollment", "cancel enrollment")
+)
+
+# Third-person patterns that do not depend on the configured relationship words
+_THIRD_PERSON_VOICE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        # "enroll my [relationship]'s voice"
+        r"\benroll\s+my\s+(\w+)\'?s\s+voice\b",
+        # "register my [relationship]'s voice"
+        r"\bregister\s+my\s+(\w+)\'?s\s+voice\b",
+        # "enroll [name]'s voice"
+        rf"\benroll\s+({_NAME_BODY_FRAGMENT})\'?s\s+voice\b",
+        # "register [name]'s voice"
+        rf"\bregister\s+({_NAME_BODY_FRAGMENT})\'?s\s+voice\b",
+    )
+)
+# Answers to "what is their name?" during third-person enrollment
+_THIRD_PERSON_ANSWER_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        rf"(?:their name is|his name is|her name is)\s+({_NAME_BODY_FRAGMENT})",
+        rf"(?:it's|its)\s+({_NAME_BODY_FRAGMENT})",
+        rf"^({_NAME_BODY_FRAGMENT})$",  # Just a name
+    )
+)
+
+# Name validation helpers
+_NAME_SEPARATORS_TABLE = str.maketrans("", "", " -'")
+_CONSECUTIVE_SEPARATORS_RE = re.compile(r"[\s\-\']{3,}")
+_GENERIC_NAMES = frozenset({"test", "admin", "root", "user"})
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"\w+")
+_TITLE_ABBREVIATIONS = {"Dr": "Dr.", "Mr": "Mr.", "Ms": "Ms.", "Mrs": "Mrs."}
+# Titles that should be rejected when they lead a name
+_UNSUPPORTED_TITLES = frozenset(
+    {
+        "professor",
+        "captain",
+        "sergeant",
+        "lieutenant",
+        "colonel",
+        "general",
+        "admiral",
+    }
+)
+# Whole-word forms ("captain ", "captain. ") for a single startswith() check
+_UNSUPPORTED_TITLE_PREFIXES = tuple(
+    title + separator for title in _UNSUPPORTED_TITLES for separator in (" ", ". ")
+)
+
+
+def _clean_name(name: str) -> str:
+    """Clean and format name properly"""
+    if not name:
+        return ""
+
+    # Remove extra whitespace
+    name = _WHITESPACE_RUN_RE.sub(" ", name.strip())
+
+    # Unsupported titles are left in place for the validator to reject.
+    # str.title() capitalizes after hyphens and apostrophes (Jean-Luc, O'Connor);
+    # supported title abbreviations are then normalized to carry a period
+    return " ".join(
+        _TITLE_ABBREVIATIONS.get(word, word) for word in name.title().split(" ")
+    )
+
+
+@lru_cache(maxsize=128)
+def _extract_name_flexible(utterance: str) -> Optional[str]:
+    """Extract name using flexible patterns for name collection (pure, so cached)"""
+    if not utterance:
+        return None
+
+    utterance = utterance.strip()
+
+    # Fast path: a single plain word such as "John" is exactly what the bare-name
+    # pattern would accept (ASCII letters, 3-50 characters), so skip the regexes
+    if 3 <= len(utterance) <= 50 and utterance.isascii() and utterance.isalpha():
+        return _clean_name(utterance)
+
+    # Pattern 1: Direct name responses like "John", "Mary Smith"
+    # Remove common phrase starters
+    cleaned_utterance = _NAME_STARTERS_RE.sub("", utterance, count=1).strip()
+
+    # Pattern 2: Extract name from common patterns - Enhanced with title support
+    # (the name fragment is at least 3 characters, so no length check is needed)
+    match = (
+        _AS_NAME_RE.search(cleaned_utterance)
+        or _NAME_KEYWORD_RE.search(cleaned_utterance)
+        or _BARE_NAME_RE.match(cleaned_utterance)
+    )
+    if not match:
+        return None
+
+    name = match.group(1)
+    LOG.debug("Extracted name: %s", name)
+    return _clean_name(name)
 
 
 class OMVAVoiceEnrollmentSkill(OVOSSkill):
@@ -40,26 +271,40 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
     - "register my voice as John"
     """
 
+    # Parsed name_extraction.patterns files by language, shared across reloads
+    _LOCALE_CACHE: Dict[str, Dict[str, List[str]]] = {}
+
     def __init__(self, bus=None, skill_id=""):
-        super().__init__(bus=bus, skill_id=skill_id)
-        self.enrollment_context = {}
+        # Defaults are set before super().__init__(), which runs initialize()
+        # when given a bus; assigning them afterwards would discard the loaded
+        # settings and locale patterns
+        self.enrollment_context = EnrollmentContext()
         self.target_samples = 3
         self.confirmation_required = True
         self.replace_existing_profiles = False
         self.relationship_words = []  # Initialize relationship words list
         self.locale_patterns = {}  # Initialize locale patterns dictionary
 
-        # Timeout configuration
-        self.enrollment_timeouts = {
-            "confirmation": 30,  # Wait for user confirmation
-            "sample_collection": 15,  # Wait for each sample
-            "between_samples": 10,  # Wait between samples
-            "overall_session": 600,  # Total enrollment session (10 minutes)
-            "processing": 30,  # Wait for plugin processing
-            "retry_confirmation": 30,  # Wait for retry confirmation
-            "name_collection": 30,  # Wait for third-person name collection
-        }
+        # Compiled by _rebuild_patterns() once settings and locale are loaded
+        self._compiled_dynamic_patterns = ()
+        self._compiled_third_person_patterns = _THIRD_PERSON_VOICE_PATTERNS
+        self._relationship_set = frozenset()
+        self._relationship_tokens = frozenset()
+
         self.active_timers = {}  # Track active timeout timers
+        self._id_seq = 0  # Sequence for session-scoped sample/enrollment IDs
+        self._voice_id_bus = None  # Bus the voice ID handlers are registered on
+        super().__init__(bus=bus, skill_id=skill_id)
+
+    @property
+    def _bus_ready(self) -> bool:
+        """Whether a message bus is bound, checked against the live bus"""
+        return getattr(self, "_bus", None) is not None
+
+    def bind(self, bus):
+        """Bind the message bus and register the voice ID handlers on it"""
+        super().bind(bus)
+        self.setup_voice_id_integration()
 
     def initialize(self):
         """Initialize skill after construction"""
@@ -67,42 +312,56 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         self.setup_voice_id_integration()
         self.load_settings()
         self.load_locale_patterns()
+        self._rebuild_patterns()
 
     def load_locale_patterns(self):
         """Load locale-specific patterns for name extraction"""
         try:
             # Get current language/locale
             lang = self.lang if hasattr(self, "lang") else "en-us"
-            patterns_file = self.find_resource(
-                "patterns/name_extraction.patterns", lang
-            )
+            locale_patterns = self._LOCALE_CACHE.get(lang)
 
-            if not patterns_file:
+            if locale_patterns is None:
+                patterns_file = self.find_resource(
+                    "patterns/name_extraction.patterns", lang
+                )
+                if patterns_file:
+                    locale_patterns = self._read_locale_patterns(patterns_file)
+                    self._LOCALE_CACHE[lang] = locale_patterns
+                    LOG.info(
+                        "Loaded locale patterns for %s: %s pattern types",
+                        lang,
+                        len(locale_patterns),
+                    )
+
+            if locale_patterns is None:
                 LOG.warning(
-                    f"No name extraction patterns found for {lang}, falling back to hardcoded English patterns"
+                    "No name extraction patterns found for %s, falling back to hardcoded English patterns",
+                    lang,
                 )
                 self.use_fallback_patterns()
-                return
-
-            self.locale_patterns = {}
-            with open(patterns_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        if ":" in line:
-                            pattern_type, pattern = line.split(":", 1)
-                            if pattern_type not in self.locale_patterns:
-                                self.locale_patterns[pattern_type] = []
-                            self.locale_patterns[pattern_type].append(pattern.strip())
-
-            LOG.info(
-                f"Loaded locale patterns for {lang}: {len(self.locale_patterns)} pattern types"
-            )
+            else:
+                self.locale_patterns = locale_patterns
 
         except Exception as e:
-            LOG.error(f"Error loading locale patterns: {e}")
+            LOG.error("Error loading locale patterns: %s", e)
             self.use_fallback_patterns()
 
+    @staticmethod
+    def _read_locale_patterns(patterns_file: str) -> Dict[str, List[str]]:
+        """Parse a pattern_type:pattern file into lists of patterns by type"""
+        locale_patterns: Dict[str, List[str]] = {}
+        with open(patterns_file, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith("#") and ":" in line:
+                pattern_type, pattern = line.split(":", 1)
+                locale_patterns.setdefault(pattern_type, []).append(pattern.strip())
+
+        return locale_patterns
+
     def use_fallback_patterns(self):
         """Use fallback English patterns when locale patterns aren't available"""
         self.locale_patterns = {
@@ -127,70 +386,84 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             "third_person_standalone": ["{relationship} {name}"],
         }
 
+    def _rebuild_patterns(self):
+        """Compile the locale and relationship-word patterns used per utterance"""
+        try:
+            self._compiled_dynamic_patterns = tuple(
+                re.compile(pattern, re.IGNORECASE)
+                for pattern in self.build_dynamic_patterns()
+            )
+        except re.error as e:
+            LOG.warning(
+                "Error compiling locale patterns, falling back to hardcoded patterns: %s",
+                e,
+            )
+            self._compiled_dynamic_patterns = ()
+
+        # Relationship patterns can only match when the utterance contains the
+        # first word of some relationship, so those words double as a prefilter
+        self._relationship_set = frozenset(self.relationship_words)
+        self._relationship_tokens = frozenset(
+            tokens[0]
+            for tokens in map(_WORD_RE.findall, self._relationship_set)
+            if tokens
+        )
+
+        # Create dynamic relationship pattern based on configured words
+        relationship_list = _alternation(self.relationship_words)
+
+        # Dynamic patterns built with relationship words
+        dynamic_patterns = [
+            # "my [relationship] [name]"
+            rf"\bmy\s+(?:{relationship_list})\s+({_NAME_BODY_FRAGMENT})\b",
+            # "[relationship] [name]"
+            rf"\b(?:{relationship_list})\s+({_NAME_BODY_FRAGMENT})\b",
+        ]
+
+        self._compiled_third_person_patterns = _THIRD_PERSON_VOICE_PATTERNS + tuple(
+            re.compile(pattern, re.IGNORECASE) for pattern in dynamic_patterns
+        )
+
     def build_dynamic_patterns(self):
-        """Build regex patterns from locale-specific templates"""
+        """Build regex patterns from locale-specific templates
+
+        Patterns follow the fallback priority: "as/for [Name]" first, then the
+        name introductions, whose capture stops before a preposition keyword or
+        an enrollment verb ("this is John enroll my voice" yields John).
+        """
         patterns = []
 
         # Get pattern components
-        enrollment_actions = self.locale_patterns.get("enrollment_action", ["enroll"])
-        possessives = self.locale_patterns.get("possessive", ["my"])
-        voice_terms = self.locale_patterns.get("voice_term", ["voice"])
         name_intros = self.locale_patterns.get("name_intro", ["my name is"])
-
-        # Build basic name extraction patterns
-        for intro in name_intros:
-            pattern = rf"\b{re.escape(intro)}\s+((?:Dr\.?\s+|Mr\.?\s+|Ms\.?\s+|Mrs\.?\s+|Miss\s+)?[a-zA-Z][a-zA-Z\s\-\'\.{{1,48}}[a-zA-Z])\b"
-            patterns.append(pattern)
+        stop_words = list(self.locale_patterns.get("enrollment_action", []))
 
         # Build "as [Name]" and "for [Name]" patterns
         for prep_pattern in self.locale_patterns.get("name_with_preposition", []):
             if "{name}" in prep_pattern:
-                pattern_template = prep_pattern.replace(
-                    "{name}",
-                    r"((?:Dr\.?\s+|Mr\.?\s+|Ms\.?\s+|Mrs\.?\s+|Miss\s+)?[a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])",
+                # Escape only the literal text around the placeholder
+                before, after = prep_pattern.split("{name}", 1)
+                pattern = (
+                    rf"\b{re.escape(before)}({_NAME_FRAGMENT}){re.escape(after)}\b"
                 )
-                pattern = rf"\b{re.escape(pattern_template)}\b".replace(
-                    r"\(", "("
-                ).replace(r"\)", ")")
                 patterns.append(pattern)
+                if before.strip():
+                    stop_words.append(before.strip())
+
+        # Introduced names may not start with, or run on into, a stop word
+        intro_name = _NAME_FRAGMENT
+        if stop_words:
+            stop = rf"(?:{_alternation(stop_words)})\b"
+            intro_name = (
+                rf"{_TITLE_FRAGMENT}(?!{stop})[a-zA-Z]"
+                rf"(?:(?!\s+{stop})[a-zA-Z\s\-\'\.]){{1,48}}[a-zA-Z]"
+            )
 
-        return patterns
-
-    def build_third_person_patterns(self):
-        """Build third-person enrollment patterns from locale templates"""
-        patterns = []
-
-        # Get pattern components
-        enrollment_actions = self.locale_patterns.get("enrollment_action", ["enroll"])
-        possessives = self.locale_patterns.get("possessive", ["my"])
-        voice_terms = self.locale_patterns.get("voice_term", ["voice"])
-
-        # Create dynamic relationship pattern
-        relationship_list = "|".join(
-            re.escape(word) for word in self.relationship_words
-        )
-
-        # Build basic third-person patterns
-        basic_patterns = [
-            # "enroll my [relationship]'s voice"
-            rf"\b(?:{'|'.join(re.escape(action) for action in enrollment_actions)})\s+(?:{'|'.join(re.escape(poss) for poss in possessives)})\s+(\w+)\'?s\s+(?:{'|'.join(re.escape(term) for term in voice_terms)})\b",
-            # "enroll [name]'s voice"
-            rf"\b(?:{'|'.join(re.escape(action) for action in enrollment_actions)})\s+([a-zA-Z][a-zA-Z\s\-\'\.{{1,48}}[a-zA-Z])\'?s\s+(?:{'|'.join(re.escape(term) for term in voice_terms)})\b",
-        ]
-
-        # Build relationship-based patterns
-        for poss in possessives:
-            # "my [relationship] [name]"
-            pattern = rf"\b{re.escape(poss)}\s+(?:{relationship_list})\s+([a-zA-Z][a-zA-Z\s\-\'\.{{1,48}}[a-zA-Z])\b"
-            basic_patterns.append(pattern)
-
-        # "[relationship] [name]"
-        pattern = (
-            rf"\b(?:{relationship_list})\s+([a-zA-Z][a-zA-Z\s\-\'\.{{1,48}}[a-zA-Z])\b"
-        )
-        basic_patterns.append(pattern)
+        # Build basic name extraction patterns
+        for intro in name_intros:
+            pattern = rf"\b{re.escape(intro)}\s+({intro_name})\b"
+            patterns.append(pattern)
 
-        return basic_patterns
+        return patterns
 
     def load_settings(self):
         """Load skill settings with defaults"""
@@ -251,30 +524,40 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             self.relationship_words = default_relationships
 
         LOG.info(
-            f"Settings loaded: {self.target_samples} samples, confirmation: {self.confirmation_required}, "
-            f"relationship_words: {len(self.relationship_words)} terms"
+            "Settings loaded: %s samples, confirmation: %s, relationship_words: %s terms",
+            self.target_samples,
+            self.confirmation_required,
+            len(self.relationship_words),
         )
 
     def settings_changed_callback(self):
         """Called when skill settings are changed"""
         LOG.info("Settings updated, reloading configuration")
         self.load_settings()
+        self._rebuild_patterns()
 
     def on_lang_changed(self, message):
         """Called when language/locale changes"""
-        LOG.info(f"Language changed, reloading locale patterns")
+        LOG.info("Language changed, reloading locale patterns")
         self.load_locale_patterns()
+        self._rebuild_patterns()
 
     def setup_voice_id_integration(self):
         """Setup integration with voice identification plugin"""
         # Only set up bus integration if bus is available
-        if hasattr(self, "_bus") and self._bus is not None:
-            self.bus.on("ovos.voiceid.enroll.response", self.handle_enrollment_response)
-            self.bus.on("ovos.voiceid.users.response", self.handle_users_response)
-            self.bus.on(MessageBusEvents.SAMPLE_COLLECTED, self.handle_sample_collected)
-            LOG.debug("Voice ID integration setup complete")
-        else:
+        if not self._bus_ready:
             LOG.debug("Bus not available during initialization")
+            return
+
+        # bind() and initialize() both land here; register once per bus
+        if self._voice_id_bus is self.bus:
+            return
+
+        self._voice_id_bus = self.bus
+        self.bus.on("ovos.voiceid.enroll.response", self.handle_enrollment_response)
+        self.bus.on("ovos.voiceid.users.response", self.handle_users_response)
+        self.bus.on(MessageBusEvents.SAMPLE_COLLECTED, self.handle_sample_collected)
+        LOG.debug("Voice ID integration setup complete")
 
     # Primary Intent Handlers
 
@@ -316,23 +599,25 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
     # Confirmation Intent Handlers
 
     @intent_handler(
-        IntentBuilder("ConfirmEnrollmentYes")
-        .require("YesKeyword")
+        IntentBuilder("ConfirmEnrollmentResponse")
+        .one_of("YesKeyword", "NoKeyword")
         .require("AwaitingEnrollmentConfirmation")
         .build()
     )
+    def handle_confirm_enrollment_response(self, message):
+        """Route yes/no answers to the enrollment confirmation prompt"""
+        if message.data.get("YesKeyword"):
+            self.handle_confirm_enrollment_yes(message)
+        else:
+            self.handle_confirm_enrollment_no(message)
+
     def handle_confirm_enrollment_yes(self, message):
         """Handle positive confirmation for enrollment"""
         LOG.info("Enrollment confirmed by user")
         self.remove_context("AwaitingEnrollmentConfirmation")
+        self.cancel_enrollment_timeout("confirmation")
         self.proceed_with_enrollment()
 
-    @intent_handler(
-        IntentBuilder("ConfirmEnrollmentNo")
-        .require("NoKeyword")
-        .require("AwaitingEnrollmentConfirmation")
-        .build()
-    )
     def handle_confirm_enrollment_no(self, message):
         """Handle negative confirmation for enrollment"""
         LOG.info("Enrollment cancelled by user")
@@ -350,18 +635,15 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
     def handle_third_person_name_provided(self, message):
         """Handle name provided for third-person enrollment"""
         utterance = message.data.get("utterance", "")
-        LOG.info(f"Processing third-person name from utterance: {utterance}")
+        LOG.info("Processing third-person name from utterance: %s", utterance)
 
         # Extract name from the utterance using existing patterns
         extracted_name = None
 
         # Try standard name extraction patterns
-        for pattern in [
-            r"(?:their name is|his name is|her name is)\s+([a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])",
-            r"(?:it's|its)\s+([a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])",
-            r"^([a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])$",  # Just a name
-        ]:
-            match = re.search(pattern, utterance.strip(), re.IGNORECASE)
+        stripped_utterance = utterance.strip()
+        for pattern in _THIRD_PERSON_ANSWER_PATTERNS:
+            match = pattern.search(stripped_utterance)
             if match:
                 extracted_name = match.group(1).strip()
                 break
@@ -370,8 +652,8 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             cleaned_name = self.clean_name(extracted_name)
             if self._is_valid_name_with_supported_title(cleaned_name):
                 # Confirm the name and proceed
-                self.enrollment_context["user_name"] = cleaned_name
-                self.enrollment_context["state"] = "confirmation"
+                self.enrollment_context.user_name = cleaned_name
+                self.enrollment_context.state = "confirmation"
                 self.remove_context("AwaitingThirdPersonName")
 
                 # Confirm the third-person enrollment
@@ -383,7 +665,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
                     self.set_context("AwaitingEnrollmentConfirmation")
                     self.set_enrollment_timeout(
                         "confirmation",
-                        self.enrollment_timeouts["confirmation"],
+                        EnrollmentTimeouts.CONFIRMATION,
                         self.handle_confirmation_timeout,
                     )
                 else:
@@ -392,12 +674,14 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
 
         # Invalid or no name provided
         self.speak_dialog("name_invalid")
-        relationship = self.enrollment_context.get("relationship", "someone else")
+        relationship = self.enrollment_context.relationship or "someone else"
         self.speak_dialog("third_person_enrollment", {"relationship": relationship})
 
         # Reset timeout
         self.set_enrollment_timeout(
-            "name_collection", 30, self.handle_name_collection_timeout
+            "name_collection",
+            EnrollmentTimeouts.NAME_COLLECTION,
+            self.handle_name_collection_timeout,
         )
 
     # Voice Profile Management Intent Handlers
@@ -413,7 +697,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         """Handle request to list enrolled users"""
         LOG.info("List enrolled users intent triggered")
 
-        if hasattr(self, "_bus") and self._bus is not None:
+        if self._bus_ready:
             # Request user list from voice ID plugin
             self.bus.emit(Message(MessageBusEvents.GET_USERS, {}))
 
@@ -432,23 +716,8 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         utterance = message.data.get("utterance", "").lower()
 
         # Check for restart/change name requests
-        restart_phrases = [
-            "restart",
-            "start over",
-            "start again",
-            "begin again",
-            "restart enrollment",
-            "change name",
-            "different name",
-            "wrong name",
-            "use different name",
-            "that's wrong",
-            "that's not right",
-            "not that name",
-        ]
-
-        if any(phrase in utterance for phrase in restart_phrases):
-            LOG.info(f"User requested name change/restart: {utterance}")
+        if _NAME_RESTART_RE.search(utterance):
+            LOG.info("User requested name change/restart: %s", utterance)
             self.remove_context("AwaitingUserName")
             self.speak_dialog("name_change_requested")
             # Restart name collection
@@ -456,22 +725,8 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             return
 
         # Check for abort/cancel during name collection
-        abort_phrases = [
-            "cancel",
-            "stop",
-            "abort",
-            "quit",
-            "exit",
-            "nevermind",
-            "never mind",
-            "forget it",
-            "not now",
-            "no thanks",
-            "i changed my mind",
-        ]
-
-        if any(phrase in utterance for phrase in abort_phrases):
-            LOG.info(f"User aborted during name collection: {utterance}")
+        if _NAME_ABORT_RE.search(utterance):
+            LOG.info("User aborted during name collection: %s", utterance)
             self.remove_context("AwaitingUserName")
             self.speak_dialog("enrollment_cancelled")
             self.cleanup_enrollment_session()
@@ -480,78 +735,18 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         user_name = self.extract_name_from_utterance_flexible(utterance)
 
         if user_name and self.validate_user_name(user_name):
-            LOG.info(f"Valid name collected: {user_name}")
+            LOG.info("Valid name collected: %s", user_name)
             self.remove_context("AwaitingUserName")
-            self.enrollment_context["user_name"] = user_name
-            self.enrollment_context["state"] = "sample_collection"
-            self.enrollment_context["samples"] = []
-            self.enrollment_context["current_sample_index"] = 0
-
-            # Notify VoiceID plugin about enrollment session start
-            if hasattr(self, "_bus") and self._bus is not None:
-                self.bus.emit(
-                    Message(
-                        MessageBusEvents.START_ENROLLMENT,
-                        {
-                            "session_id": self.enrollment_context.get("session_id"),
-                            "user_id": self.enrollment_context["user_name"],
-                            "target_samples": self.enrollment_context["target_samples"],
-                            "timestamp": datetime.now().isoformat(),
-                        },
-                    )
-                )
-
-            self.speak_dialog("name_confirmed", {"name": user_name})
-            # Start sample collection immediately after name confirmation
-            self.start_sample_collection()
+            self.enrollment_context.user_name = user_name
+            self._begin_sample_collection("name_confirmed", {"name": user_name})
         else:
-            LOG.warning(f"Invalid name provided: {user_name}")
+            LOG.warning("Invalid name provided: %s", user_name)
             self.speak_dialog("name_invalid")
             self.speak_dialog("request_name")
 
     def extract_name_from_utterance_flexible(self, utterance: str) -> Optional[str]:
         """Extract name from utterance using flexible patterns for name collection"""
-        if not utterance:
-            return None
-
-        utterance = utterance.strip()
-
-        # Pattern 1: Direct name responses like "John", "Mary Smith"
-        # Remove common phrase starters
-        name_starters = [
-            r"^my name is\s+",
-            r"^i\'?m\s+",
-            r"^call me\s+",
-            r"^it\'?s\s+",
-            r"^the name is\s+",
-            r"^use\s+",
-        ]
-
-        cleaned_utterance = utterance
-        for pattern in name_starters:
-            cleaned_utterance = re.sub(
-                pattern, "", cleaned_utterance, flags=re.IGNORECASE
-            )
-
-        # Pattern 2: Extract name from common patterns - Enhanced with title support
-        name_patterns = [
-            # Check "as NAME" first - with title support
-            r"as\s+((?:Dr\.?\s+|Mr\.?\s+|Ms\.?\s+|Mrs\.?\s+|Miss\s+)?[a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])",
-            # Then "name NAME" - with title support
-            r"name\s+((?:Dr\.?\s+|Mr\.?\s+|Ms\.?\s+|Mrs\.?\s+|Miss\s+)?[a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])",
-            # Finally direct name - with title support
-            r"^((?:Dr\.?\s+|Mr\.?\s+|Ms\.?\s+|Mrs\.?\s+|Miss\s+)?[a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])$",
-        ]
-
-        for pattern in name_patterns:
-            match = re.search(pattern, cleaned_utterance.strip(), re.IGNORECASE)
-            if match:
-                name = match.group(1).strip()
-                if len(name) >= 2:
-                    LOG.debug(f"Extracted name: {name}")
-                    return self.clean_name(name)
-
-        return None
+        return _extract_name_flexible(utterance)
 
     def validate_user_name(self, name: str) -> bool:
         """Validate user name meets requirements"""
@@ -565,149 +760,66 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             return False
 
         # Character requirements - allow letters (including Unicode), spaces, hyphens, apostrophes
-        # Use Unicode character categories for better international name support
-        import unicodedata
-
-        # Check if name contains only valid characters (letters, spaces, hyphens, apostrophes)
-        valid_chars = True
-        for char in name:
-            if not (
-                unicodedata.category(char).startswith("L")  # Letters (any language)
-                or char in " '-"
-            ):  # Spaces, hyphens, apostrophes
-                valid_chars = False
-                break
-
-        if not valid_chars:
+        # str.isalpha() covers every Unicode letter category for international names
+        if not name.translate(_NAME_SEPARATORS_TABLE).isalpha():
             return False
 
         # Ensure name starts and ends with a letter
-        if not (
-            unicodedata.category(name[0]).startswith("L")
-            and unicodedata.category(name[-1]).startswith("L")
-        ):
+        if not (name[0].isalpha() and name[-1].isalpha()):
             return False
 
         # Prevent excessive consecutive spaces or special chars
-        if re.search(r"[\s\-\']{3,}", name):
+        if _CONSECUTIVE_SEPARATORS_RE.search(name):
             return False
 
-        # Common name validation - no numbers, no profanity placeholders
-        invalid_patterns = [
-            r"\d",  # No numbers
-            r"[!@#$%^&*()_+=\[\]{}|;:,.<>?/~`]",  # No special chars except allowed
-            r"^(test|admin|root|user)$",  # No generic names
-        ]
-
-        for pattern in invalid_patterns:
-            if re.search(pattern, name, re.IGNORECASE):
-                return False
+        # No generic names (numbers and special chars are already rejected above)
+        if name.lower() in _GENERIC_NAMES:
+            return False
 
         return True
 
     def clean_name(self, name: str) -> str:
         """Clean and format name properly"""
-        if not name:
-            return ""
-
-        # Remove extra whitespace
-        name = re.sub(r"\s+", " ", name.strip())
-
-        # Check if this contains unsupported titles that should be rejected
-        unsupported_titles = [
-            "professor",
-            "captain",
-            "sergeant",
-            "lieutenant",
-            "colonel",
-            "general",
-            "admiral",
-        ]
-        first_word = name.split()[0].lower().rstrip(".")
-        if first_word in unsupported_titles:
-            # Return the original name as-is, but the calling function should handle validation
-            pass
-
-        # Handle special cases for proper capitalization
-        parts = []
-        for word in name.split():
-            # Handle titles specially
-            if word.lower() in [
-                "dr",
-                "dr.",
-                "mr",
-                "mr.",
-                "ms",
-                "ms.",
-                "mrs",
-                "mrs.",
-                "miss",
-            ]:
-                if word.lower() in ["dr", "dr."]:
-                    parts.append("Dr.")
-                elif word.lower() in ["mr", "mr."]:
-                    parts.append("Mr.")
-                elif word.lower() in ["ms", "ms."]:
-                    parts.append("Ms.")
-                elif word.lower() in ["mrs", "mrs."]:
-                    parts.append("Mrs.")
-                elif word.lower() == "miss":
-                    parts.append("Miss")
-            elif "-" in word:
-                # Handle hyphenated names like Jean-Luc
-                parts.append("-".join(part.capitalize() for part in word.split("-")))
-            elif "'" in word:
-                # Handle apostrophes like O'Connor
-                apostrophe_parts = word.split("'")
-                formatted_parts = []
-                for i, part in enumerate(apostrophe_parts):
-                    if i == 0:
-                        formatted_parts.append(part.capitalize())
-                    else:
-                        # Capitalize after apostrophe
-                        formatted_parts.append(part.capitalize())
-                parts.append("'".join(formatted_parts))
-            else:
-                parts.append(word.capitalize())
-
-        return " ".join(parts)
+        return _clean_name(name)
 
     def proceed_with_enrollment(self):
         """Continue with enrollment after confirmation"""
-        if not self.enrollment_context.get("user_name"):
+        context = self.enrollment_context
+        if not context.user_name:
             # Need to collect name first
-            self.enrollment_context["state"] = "name_collection"
+            context.state = "name_collection"
             self.speak_dialog("request_name")
             self.set_context("AwaitingUserName")
         else:
-            # Have name, proceed to sample collection
-            self.enrollment_context["state"] = "sample_collection"
-            self.enrollment_context["samples"] = []
-            self.enrollment_context["current_sample_index"] = 0
-
-            # Notify VoiceID plugin about enrollment session start
-            if hasattr(self, "_bus") and self._bus is not None:
-                self.bus.emit(
-                    Message(
-                        MessageBusEvents.START_ENROLLMENT,
-                        {
-                            "session_id": self.enrollment_context.get("session_id"),
-                            "user_id": self.enrollment_context["user_name"],
-                            "target_samples": self.enrollment_context["target_samples"],
-                            "timestamp": datetime.now().isoformat(),
-                        },
-                    )
-                )
-
-            self.speak_dialog(
+            # Have name, proceed to sample collection - no need for extra confirmation
+            self._begin_sample_collection(
                 "ready_for_samples",
                 {
-                    "name": self.enrollment_context["user_name"],
-                    "count": self.enrollment_context["target_samples"],
+                    "name": context.user_name,
+                    "count": context.target_samples,
                 },
             )
-            # Start sample collection immediately - no need for extra confirmation
-            self.start_sample_collection()
+
+    def _begin_sample_collection(self, dialog: str, dialog_data: Dict[str, Any]):
+        """Reset sample progress, notify the VoiceID plugin and start collecting"""
+        context = self.enrollment_context
+        context.state = "sample_collection"
+        context.samples = []
+        context.current_sample_index = 0
+
+        # Notify VoiceID plugin about enrollment session start
+        self._emit(
+            MessageBusEvents.START_ENROLLMENT,
+            {
+                "session_id": context.session_id,
+                "user_id": context.user_name,
+                "target_samples": context.target_samples,
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+
+        self.speak_dialog(dialog, dialog_data)
+        self.start_sample_collection()
 
     def extract_user_name_from_utterance(self, utterance: str) -> Optional[str]:
         """Extract user name from utterance using locale-aware patterns"""
@@ -720,48 +832,37 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             return third_person_result
 
         # Use dynamically built patterns from locale
-        try:
-            patterns = self.build_dynamic_patterns()
-            for pattern in patterns:
-                match = re.search(pattern, utterance, re.IGNORECASE)
-                if match:
-                    name = match.group(1).strip()
-                    cleaned_name = self.clean_name(name)
-                    if self._is_valid_name_with_supported_title(cleaned_name):
-                        LOG.debug(
-                            f"Extracted name using locale pattern: {cleaned_name}"
-                        )
-                        return cleaned_name
-        except Exception as e:
-            LOG.warning(
-                f"Error using locale patterns, falling back to hardcoded patterns: {e}"
-            )
+        name = self._search_name_patterns(
+            self._compiled_dynamic_patterns, utterance, "locale"
+        )
+        if name:
+            return name
 
         # Fallback to hardcoded patterns if locale patterns fail
         return self._extract_name_fallback(utterance)
 
     def _extract_name_fallback(self, utterance: str) -> Optional[str]:
         """Fallback name extraction using hardcoded English patterns"""
-        patterns = [
-            # "as [Name]" - Enhanced to handle titles
-            r"\bas\s+((?:Dr\.?\s+|Mr\.?\s+|Ms\.?\s+|Mrs\.?\s+|Miss\s+)?[a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])\b",
-            # "for [Name]" - Enhanced to handle titles
-            r"\bfor\s+((?:Dr\.?\s+|Mr\.?\s+|Ms\.?\s+|Mrs\.?\s+|Miss\s+)?[a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])\b",
-            # "my name is [Name]"
-            r"\bmy\s+name\s+is\s+((?:Dr\.?\s+|Mr\.?\s+|Ms\.?\s+|Mrs\.?\s+|Miss\s+)?[a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])\b",
-            # "I'm [Name]" or "I am [Name]"
-            r"\b(?:i\'?m|i\s+am)\s+((?:Dr\.?\s+|Mr\.?\s+|Ms\.?\s+|Mrs\.?\s+|Miss\s+)?[a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])\b",
-            # "call me [Name]"
-            r"\bcall\s+me\s+((?:Dr\.?\s+|Mr\.?\s+|Ms\.?\s+|Mrs\.?\s+|Miss\s+)?[a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])\b",
-        ]
+        return self._search_name_patterns(
+            _FALLBACK_NAME_PATTERNS, utterance, "fallback"
+        )
+
+    def _search_name_patterns(
+        self, patterns: Iterable["re.Pattern[str]"], utterance: str, source: str
+    ) -> Optional[str]:
+        """Return the first cleaned name with a supported title matched by patterns
 
+        Patterns are tried in order, so callers pass them in priority order;
+        source only labels the debug log ("locale" or "fallback").
+        """
         for pattern in patterns:
-            match = re.search(pattern, utterance, re.IGNORECASE)
+            match = pattern.search(utterance)
             if match:
-                name = match.group(1).strip()
-                cleaned_name = self.clean_name(name)
+                cleaned_name = self.clean_name(match.group(1).strip())
                 if self._is_valid_name_with_supported_title(cleaned_name):
-                    LOG.debug(f"Extracted name using fallback pattern: {cleaned_name}")
+                    LOG.debug(
+                        "Extracted name using %s pattern: %s", source, cleaned_name
+                    )
                     return cleaned_name
 
         return None
@@ -771,50 +872,23 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         if not utterance:
             return None
 
-        # Create dynamic relationship pattern based on configured words
-        relationship_list = "|".join(
-            re.escape(word) for word in self.relationship_words
-        )
-
-        # Family/relationship patterns with dynamic relationship words
-        basic_patterns = [
-            # "enroll my [relationship]'s voice"
-            r"\benroll\s+my\s+(\w+)\'?s\s+voice\b",
-            # "register my [relationship]'s voice"
-            r"\bregister\s+my\s+(\w+)\'?s\s+voice\b",
-            # "enroll [name]'s voice"
-            r"\benroll\s+([a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])\'?s\s+voice\b",
-            # "register [name]'s voice"
-            r"\bregister\s+([a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])\'?s\s+voice\b",
-        ]
+        patterns = self._compiled_third_person_patterns
+        if self._relationship_tokens.isdisjoint(_WORD_RE.findall(utterance.lower())):
+            patterns = _THIRD_PERSON_VOICE_PATTERNS
 
-        # Dynamic patterns built with relationship words
-        dynamic_patterns = [
-            # "my [relationship] [name]"
-            r"\bmy\s+(?:"
-            + relationship_list
-            + r")\s+([a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])\b",
-            # "[relationship] [name]"
-            r"\b(?:"
-            + relationship_list
-            + r")\s+([a-zA-Z][a-zA-Z\s\-\'\.]{1,48}[a-zA-Z])\b",
-        ]
-
-        relationship_patterns = basic_patterns + dynamic_patterns
-
-        for pattern in relationship_patterns:
-            match = re.search(pattern, utterance, re.IGNORECASE)
+        for pattern in patterns:
+            match = pattern.search(utterance)
             if match:
                 extracted = match.group(1).strip()
 
                 # Check if it's a relationship word (needs name collection)
-                if extracted.lower() in self.relationship_words:
+                if extracted.lower() in self._relationship_set:
                     # Mark this as a third-person scenario requiring name collection
-                    self.enrollment_context = getattr(self, "enrollment_context", {})
-                    self.enrollment_context["third_person"] = True
-                    self.enrollment_context["relationship"] = extracted.lower()
+                    self.enrollment_context.third_person = True
+                    self.enrollment_context.relationship = extracted.lower()
                     LOG.debug(
-                        f"Detected third-person enrollment for relationship: {extracted}"
+                        "Detected third-person enrollment for relationship: %s",
+                        extracted,
                     )
                     return None  # Will prompt for actual name
                 else:
@@ -822,11 +896,8 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
                     cleaned_name = self.clean_name(extracted)
                     if self._is_valid_name_with_supported_title(cleaned_name):
                         # Mark as third-person but with known name
-                        self.enrollment_context = getattr(
-                            self, "enrollment_context", {}
-                        )
-                        self.enrollment_context["third_person"] = True
-                        LOG.debug(f"Extracted third-person name: {cleaned_name}")
+                        self.enrollment_context.third_person = True
+                        LOG.debug("Extracted third-person name: %s", cleaned_name)
                         return cleaned_name
 
         return None
@@ -836,66 +907,39 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         if not name:
             return False
 
-        # List of supported titles
-        supported_titles = ["dr.", "mr.", "ms.", "mrs.", "miss"]
-
-        # List of unsupported titles that should be rejected
-        unsupported_titles = [
-            "professor",
-            "captain",
-            "sergeant",
-            "lieutenant",
-            "colonel",
-            "general",
-            "admiral",
-        ]
-
-        first_word = name.split()[0].lower().rstrip(".")
-
-        # If it starts with an unsupported title, reject it
-        if first_word in unsupported_titles:
-            return False
-
-        return True
+        # If it starts with an unsupported title, reject it (the trailing space
+        # lets a bare title such as "Captain" match its whole-word prefix)
+        return not (name.lower() + " ").startswith(_UNSUPPORTED_TITLE_PREFIXES)
 
     def start_enrollment_flow(self, user_name: Optional[str], trigger: str = "unknown"):
         """Start the voice enrollment flow"""
         LOG.info(
-            f"Starting enrollment flow - user_name: {user_name}, trigger: {trigger}"
+            "Starting enrollment flow - user_name: %s, trigger: %s", user_name, trigger
         )
 
         # Cancel any existing timeouts first
         self.cancel_all_enrollment_timeouts()
 
-        # Initialize enrollment context
-        if not hasattr(self, "enrollment_context") or not self.enrollment_context:
-            self.enrollment_context = {}
-
         # Check if this is a third-person enrollment scenario
-        is_third_person = self.enrollment_context.get("third_person", False)
-        relationship = self.enrollment_context.get("relationship")
+        context = self.enrollment_context
+        is_third_person = context.third_person
+        relationship = context.relationship
 
         # Update enrollment context
-        self.enrollment_context.update(
-            {
-                "state": (
-                    "confirmation"
-                    if not is_third_person or user_name
-                    else "name_collection"
-                ),
-                "user_name": user_name,
-                "trigger": trigger,
-                "samples_collected": 0,
-                "target_samples": self.target_samples,
-                "started_at": datetime.now().isoformat(),
-                "session_id": str(uuid.uuid4())[:8],  # Short session ID for logging
-            }
+        context.state = (
+            "confirmation" if not is_third_person or user_name else "name_collection"
         )
+        context.user_name = user_name
+        context.trigger = trigger
+        context.samples_collected = 0
+        context.target_samples = self.target_samples
+        context.started_at = datetime.now().isoformat()
+        context.session_id = os.urandom(4).hex()  # Short session ID for logging
 
         # Set overall session timeout
         self.set_enrollment_timeout(
             "overall_session",
-            self.enrollment_timeouts["overall_session"],
+            EnrollmentTimeouts.OVERALL_SESSION,
             self.handle_session_timeout,
         )
 
@@ -914,7 +958,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             self.set_context("AwaitingThirdPersonName")
             self.set_enrollment_timeout(
                 "name_collection",
-                self.enrollment_timeouts.get("name_collection", 30),
+                EnrollmentTimeouts.NAME_COLLECTION,
                 self.handle_name_collection_timeout,
             )
             return
@@ -934,7 +978,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             # Set confirmation timeout
             self.set_enrollment_timeout(
                 "confirmation",
-                self.enrollment_timeouts["confirmation"],
+                EnrollmentTimeouts.CONFIRMATION,
                 self.handle_confirmation_timeout,
             )
         else:
@@ -943,23 +987,22 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
 
     def start_sample_collection(self):
         """Start collecting voice samples"""
-        if self.enrollment_context.get(
-            "current_sample_index", 0
-        ) >= self.enrollment_context.get("target_samples", 3):
+        context = self.enrollment_context
+        if context.current_sample_index >= context.target_samples:
             # All samples collected, proceed to processing
             self.finish_sample_collection()
             return
 
-        sample_index = self.enrollment_context["current_sample_index"]
-        phrase = SAMPLE_PHRASES[sample_index % len(SAMPLE_PHRASES)]
+        sample_index = context.current_sample_index
+        phrase = SAMPLE_PHRASES[sample_index % _SAMPLE_PHRASE_COUNT]
 
         # For the first sample, provide context about what we're doing
         if sample_index == 0:
             self.speak_dialog(
                 "ready_for_samples",
                 {
-                    "name": self.enrollment_context["user_name"],
-                    "count": self.enrollment_context["target_samples"],
+                    "name": context.user_name,
+                    "count": context.target_samples,
                 },
             )
 
@@ -967,18 +1010,17 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             "sample_prompt",
             {
                 "number": sample_index + 1,
-                "total": self.enrollment_context["target_samples"],
+                "total": context.target_samples,
                 "phrase": phrase,
             },
         )
 
         # Set context for recording
         self.set_context("AwaitingSample")
-        self.enrollment_context["current_phrase"] = phrase
-        self.enrollment_context["recording_start_time"] = datetime.now().isoformat()
+        context.current_phrase = phrase
 
         # Set sample timeout
-        timeout_duration = self.enrollment_timeouts.get("sample_collection", 15)
+        timeout_duration = EnrollmentTimeouts.SAMPLE_COLLECTION
         self.set_enrollment_timeout(
             "sample_collection", timeout_duration, self.handle_sample_timeout
         )
@@ -989,39 +1031,35 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
     def start_recording(self, message):
         """Notify VoiceID plugin to start collecting voice sample"""
         phrase = message.data.get("phrase", "")
-        sample_id = str(uuid.uuid4())
+        sample_id = self._next_session_scoped_id()
+        context = self.enrollment_context
+        sample_number = context.current_sample_index + 1
 
-        LOG.info(
-            f"Requesting voice sample {self.enrollment_context['current_sample_index'] + 1}: {phrase}"
-        )
+        LOG.info("Requesting voice sample %s: %s", sample_number, phrase)
 
         # Store recording info in context for tracking
-        self.enrollment_context["current_recording"] = {
+        context.current_recording = {
             "sample_id": sample_id,
             "phrase": phrase,
             "start_time": datetime.now().isoformat(),
         }
 
         # Notify VoiceID plugin to start collecting this specific sample
-        if hasattr(self, "_bus") and self._bus is not None:
-            self.bus.emit(
-                Message(
-                    MessageBusEvents.COLLECT_SAMPLE,
-                    {
-                        "session_id": self.enrollment_context.get("session_id"),
-                        "sample_id": sample_id,
-                        "phrase": phrase,
-                        "sample_number": self.enrollment_context["current_sample_index"]
-                        + 1,
-                        "total_samples": self.enrollment_context["target_samples"],
-                    },
-                )
-            )
+        self._emit(
+            MessageBusEvents.COLLECT_SAMPLE,
+            {
+                "session_id": context.session_id,
+                "sample_id": sample_id,
+                "phrase": phrase,
+                "sample_number": sample_number,
+                "total_samples": context.target_samples,
+            },
+        )
 
     def stop_recording_timeout(self, message):
         """Handle recording timeout"""
         sample_id = message.data.get("sample_id")
-        current_recording = self.enrollment_context.get("current_recording", {})
+        current_recording = self.enrollment_context.current_recording or {}
 
         if current_recording.get("sample_id") == sample_id:
             LOG.warning("Sample collection timed out")
@@ -1045,7 +1083,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
     )
     def handle_stop_enrollment(self, message):
         """Handle general stop/abort commands during any enrollment phase"""
-        if not self.enrollment_context or self.get_enrollment_state() == "idle":
+        if self.get_enrollment_state() == "idle":
             return False  # Not in enrollment, ignore
 
         utterance = message.data.get("utterance", "").lower()
@@ -1069,7 +1107,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             word in utterance.split()
             for word in ["stop", "cancel", "abort", "quit", "nevermind"]
         ):
-            LOG.info(f"User requested enrollment abort: {utterance}")
+            LOG.info("User requested enrollment abort: %s", utterance)
             self.speak_dialog("enrollment_cancelled")
             self.cleanup_enrollment_session()
             return True  # Consumed the utterance
@@ -1081,7 +1119,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
     )
     def handle_restart_enrollment(self, message):
         """Handle restart enrollment requests during any phase"""
-        if not self.enrollment_context or self.get_enrollment_state() == "idle":
+        if self.get_enrollment_state() == "idle":
             return False  # Not in enrollment, ignore
 
         LOG.info("User requested enrollment restart")
@@ -1095,7 +1133,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
 
         # Start fresh enrollment flow
         if new_name:
-            LOG.info(f"Restarting enrollment with new name: {new_name}")
+            LOG.info("Restarting enrollment with new name: %s", new_name)
             self.start_enrollment_flow(new_name, trigger="restart_with_name")
         else:
             LOG.info("Restarting enrollment - will prompt for name")
@@ -1112,15 +1150,15 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
     )
     def handle_enroll_as_different_user(self, message):
         """Handle enrollment requests with new name during active enrollment"""
-        if not self.enrollment_context or self.get_enrollment_state() == "idle":
+        if self.get_enrollment_state() == "idle":
             # Not in enrollment, treat as new enrollment
             return self.handle_enroll_voice_adapt_intent(message)
 
         new_name = message.data.get("UserName")
         if new_name:
-            LOG.info(f"User wants to restart enrollment as: {new_name}")
+            LOG.info("User wants to restart enrollment as: %s", new_name)
 
-            current_name = self.enrollment_context.get("user_name")
+            current_name = self.enrollment_context.user_name
             if current_name and current_name.lower() != new_name.lower():
                 # Different name - provide context about the switch
                 self.speak_dialog("name_switched", {"new_name": new_name})
@@ -1139,7 +1177,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
     )
     def handle_change_name_request(self, message):
         """Handle requests to change name during enrollment"""
-        if not self.enrollment_context or self.get_enrollment_state() == "idle":
+        if self.get_enrollment_state() == "idle":
             return False  # Not in enrollment, ignore
 
         utterance = message.data.get("utterance", "").lower()
@@ -1161,7 +1199,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         ]
 
         if any(pattern in utterance for pattern in name_change_patterns):
-            LOG.info(f"User wants to change name: {utterance}")
+            LOG.info("User wants to change name: %s", utterance)
 
             # Check if they provided a new name in the same utterance
             new_name = self.extract_user_name_from_utterance(
@@ -1170,14 +1208,14 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
 
             if new_name and self.validate_user_name(new_name):
                 # Direct name change with new name provided
-                LOG.info(f"Changing name to: {new_name}")
-                old_name = self.enrollment_context.get("user_name", "previous")
+                LOG.info("Changing name to: %s", new_name)
+                old_name = self.enrollment_context.user_name or "previous"
 
                 # Update enrollment context
-                self.enrollment_context["user_name"] = new_name
+                self.enrollment_context.user_name = new_name
 
                 # If we were already collecting samples, restart with new name
-                if self.enrollment_context.get("state") == "sample_collection":
+                if self.enrollment_context.state == "sample_collection":
                     self.cleanup_enrollment_session()
                     self.start_enrollment_flow(new_name, trigger="name_corrected")
                 else:
@@ -1187,7 +1225,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             else:
                 # No new name provided, prompt for it
                 self.speak_dialog("name_change_requested")
-                self.enrollment_context["state"] = "name_collection"
+                self.enrollment_context.state = "name_collection"
                 self.set_context("AwaitingUserName")
 
             return True  # Consumed the utterance
@@ -1196,23 +1234,20 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
 
     def stop_current_recording(self):
         """Request VoiceID plugin to stop current sample collection"""
-        current_recording = self.enrollment_context.get("current_recording")
+        current_recording = self.enrollment_context.current_recording
         if not current_recording:
             return
 
         LOG.info("Requesting VoiceID plugin to stop current sample collection")
 
         # Request plugin to stop collecting current sample
-        if hasattr(self, "_bus") and self._bus is not None:
-            self.bus.emit(
-                Message(
-                    MessageBusEvents.STOP_SAMPLE_COLLECTION,
-                    {
-                        "session_id": self.enrollment_context.get("session_id"),
-                        "sample_id": current_recording.get("sample_id"),
-                    },
-                )
-            )
+        self._emit(
+            MessageBusEvents.STOP_SAMPLE_COLLECTION,
+            {
+                "session_id": self.enrollment_context.session_id,
+                "sample_id": current_recording.get("sample_id"),
+            },
+        )
         # Plugin will send sample.collected message when ready
 
     def process_audio_sample(self, recording_info: Dict[str, Any]):
@@ -1227,19 +1262,17 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             "recorded_at": recording_info["start_time"],
         }
 
-        self.enrollment_context["samples"].append(sample_data)
-        self.enrollment_context["current_sample_index"] += 1
+        context = self.enrollment_context
+        context.samples.append(sample_data)
+        context.current_sample_index += 1
+        current_sample_num = len(context.samples)
+        target_samples = context.target_samples
 
-        LOG.info(
-            f"Sample {len(self.enrollment_context['samples'])} recorded for phrase: {phrase}"
-        )
+        LOG.info("Sample %s recorded for phrase: %s", current_sample_num, phrase)
 
         # Cancel sample timeout since we got a sample
         self.cancel_enrollment_timeout("sample_collection")
 
-        current_sample_num = len(self.enrollment_context["samples"])
-        target_samples = self.enrollment_context["target_samples"]
-
         self.speak_dialog(
             "sample_accepted",
             {
@@ -1250,15 +1283,17 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
 
         # Remove recording context and continue
         self.remove_context("AwaitingSample")
-        self.enrollment_context.pop("current_recording", None)
+        context.current_recording = None
 
         # Provide smooth transition to next sample or completion
         if current_sample_num < target_samples:
             # More samples needed - start next one with brief pause for UX
-            self.schedule_event(self.start_sample_collection, 1.5)
+            self.schedule_event(
+                self.start_sample_collection, DEFAULT_INTER_SAMPLE_PAUSE
+            )
         else:
-            # All samples collected - proceed to completion
-            self.schedule_event(self.finish_sample_collection, 1.0)
+            # All samples collected - proceed to completion (dialogs queue in order)
+            self.finish_sample_collection()
 
     def retry_current_sample(self):
         """Retry recording current sample"""
@@ -1266,36 +1301,37 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         self.cancel_enrollment_timeout("sample_collection")
 
         # Reset recording state
-        self.enrollment_context.pop("current_recording", None)
+        self.enrollment_context.current_recording = None
 
         # Ask if user wants to try again
         self.speak_dialog("retry_sample")
         self.set_context("AwaitingRetryConfirmation")
 
         # Set retry confirmation timeout
-        timeout_duration = self.enrollment_timeouts.get("retry_confirmation", 30)
+        timeout_duration = EnrollmentTimeouts.RETRY_CONFIRMATION
         self.set_enrollment_timeout(
             "retry_confirmation", timeout_duration, self.handle_retry_timeout
         )
 
     @intent_handler(
-        IntentBuilder("RetryYes")
-        .require("YesKeyword")
+        IntentBuilder("RetryResponse")
+        .one_of("YesKeyword", "NoKeyword")
         .require("AwaitingRetryConfirmation")
         .build()
     )
+    def handle_retry_response(self, message):
+        """Route yes/no answers to the sample retry prompt"""
+        if message.data.get("YesKeyword"):
+            self.handle_retry_yes(message)
+        else:
+            self.handle_retry_no(message)
+
     def handle_retry_yes(self, message):
         """Handle retry confirmation - yes"""
         self.cancel_enrollment_timeout("retry_confirmation")
         self.remove_context("AwaitingRetryConfirmation")
         self.start_sample_collection()
 
-    @intent_handler(
-        IntentBuilder("RetryNo")
-        .require("NoKeyword")
-        .require("AwaitingRetryConfirmation")
-        .build()
-    )
     def handle_retry_no(self, message):
         """Handle retry confirmation - no"""
         self.cancel_enrollment_timeout("retry_confirmation")
@@ -1313,7 +1349,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         """Handle continue response to timeout confirmation"""
         self.cancel_enrollment_timeout("timeout_confirmation")
         self.remove_context("AwaitingTimeoutConfirmation")
-        timeout_type = self.enrollment_context.get("timeout_type", "")
+        timeout_type = self.enrollment_context.timeout_type
 
         if timeout_type == "sample_final":
             # Continue with next sample or complete enrollment
@@ -1325,7 +1361,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             self.speak_dialog("timeout_continuing_session")
             # "Continuing enrollment. I've reset the session timer."
             # Reset the session timeout for another full duration
-            session_timeout = self.enrollment_timeouts.get("overall_session", 600)
+            session_timeout = EnrollmentTimeouts.OVERALL_SESSION
             self.set_enrollment_timeout(
                 "overall_session", session_timeout, self.handle_session_timeout
             )
@@ -1340,7 +1376,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         """Handle abort response to timeout confirmation"""
         self.cancel_enrollment_timeout("timeout_confirmation")
         self.remove_context("AwaitingTimeoutConfirmation")
-        timeout_type = self.enrollment_context.get("timeout_type", "")
+        timeout_type = self.enrollment_context.timeout_type
 
         if timeout_type == "sample_final":
             self.speak_dialog("enrollment_aborted_by_user")
@@ -1349,27 +1385,21 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             self.speak_dialog("enrollment_session_aborted")
             # "Enrollment session aborted as requested."
             # Notify plugin to clean up
-            if hasattr(self, "_bus") and self._bus is not None:
-                self.bus.emit(
-                    Message(
-                        MessageBusEvents.SESSION_EXPIRED,
-                        {
-                            "session_id": self.enrollment_context.get("session_id"),
-                            "user_name": self.enrollment_context.get("user_name"),
-                        },
-                    )
-                )
+            self._emit_session_expired()
 
         self.reset_enrollment_context()
 
     def finish_sample_collection(self):
         """Complete sample collection and proceed to processing"""
-        samples_count = len(self.enrollment_context.get("samples", []))
-        user_name = self.enrollment_context.get("user_name", "Unknown")
+        context = self.enrollment_context
+        samples_count = len(context.samples)
+        user_name = context.user_name or "Unknown"
 
-        LOG.info(f"Sample collection complete: {samples_count} samples for {user_name}")
+        LOG.info(
+            "Sample collection complete: %s samples for %s", samples_count, user_name
+        )
 
-        self.enrollment_context["state"] = EnrollmentState.PROCESSING
+        context.state = EnrollmentState.PROCESSING
         self.speak_dialog(
             "samples_complete", {"name": user_name, "count": samples_count}
         )
@@ -1379,8 +1409,9 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
 
     def send_samples_for_processing(self):
         """Send enrollment request to voice identification plugin for processing"""
-        user_name = self.enrollment_context.get("user_name")
-        samples = self.enrollment_context.get("samples", [])
+        context = self.enrollment_context
+        user_name = context.user_name
+        samples = context.samples
 
         if not user_name or not samples:
             LOG.error("Invalid enrollment context for processing")
@@ -1389,10 +1420,10 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             )
             return
 
-        enrollment_id = str(uuid.uuid4())
+        enrollment_id = self._next_session_scoped_id()
         enrollment_data = {
             "user_id": user_name,  # Plugin expects 'user_id'
-            "session_id": self.enrollment_context.get("session_id"),
+            "session_id": context.session_id,
             "enrollment_id": enrollment_id,
             "sample_count": len(samples),
             "sample_phrases": [sample["phrase"] for sample in samples],
@@ -1400,34 +1431,74 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         }
 
         # Store enrollment ID in context for response matching
-        self.enrollment_context["enrollment_id"] = enrollment_id
+        context.enrollment_id = enrollment_id
 
         LOG.info(
-            f"Requesting VoiceID plugin to process {len(samples)} samples for user: {user_name}"
+            "Requesting VoiceID plugin to process %s samples for user: %s",
+            len(samples),
+            user_name,
         )
 
         # Send enrollment request to voice identification plugin
         # Plugin will handle all audio processing from its audio transformer
-        if hasattr(self, "_bus") and self._bus is not None:
-            self.bus.emit(Message(MessageBusEvents.ENROLL_USER, enrollment_data))
+        self._emit(MessageBusEvents.ENROLL_USER, enrollment_data)
 
-        # Set timeout for processing response
-        self.schedule_event(
-            self.handle_processing_timeout, 30.0, data={"enrollment_id": enrollment_id}
+        # Set timeout for processing response (replaces any earlier attempt's)
+        self.set_enrollment_timeout(
+            "processing", EnrollmentTimeouts.PROCESSING, self.handle_processing_timeout
+        )
+
+    def _emit(self, event: str, data: Dict[str, Any]):
+        """Emit a message on the bus if it is available"""
+        if self._bus_ready:
+            self.bus.emit(Message(event, data))
+
+    def _emit_session_expired(self, reason: Optional[str] = None):
+        """Tell the VoiceID plugin the current enrollment session is over"""
+        context = self.enrollment_context
+        data = {"session_id": context.session_id, "user_name": context.user_name}
+        if reason:
+            data["reason"] = reason
+        self._emit(MessageBusEvents.SESSION_EXPIRED, data)
+
+    def _next_session_scoped_id(self) -> str:
+        """Return a unique ID for a sample or enrollment request in this session"""
+        self._id_seq += 1
+        return f"{self.enrollment_context.session_id}-{self._id_seq}"
+
+    def _speak_dialogs(self, *dialogs: Union[str, Tuple[str, Dict[str, Any]]]):
+        """Speak several dialogs as a single utterance (one TTS request)
+
+        Each dialog is either a dialog name or a (name, data) tuple.
+        """
+        entries = [(d, None) if isinstance(d, str) else d for d in dialogs]
+        if not self.dialog_renderer:
+            for key, data in entries:
+                self.speak_dialog(key, data)
+            return
+
+        # speak meta carries one dialog name, so report the leading dialog
+        first_key, first_data = entries[0]
+        self.speak(
+            " ".join(
+                self.dialog_renderer.render(key, data or {}) for key, data in entries
+            ),
+            meta={"dialog": first_key, "data": first_data or {}},
         )
 
     def get_enrollment_state(self) -> str:
         """Get current enrollment state"""
-        return self.enrollment_context.get("state", "idle")
+        return self.enrollment_context.state
 
     def clear_enrollment_context(self):
-        """Clear enrollment context"""
-        self.enrollment_context = {}
+        """Clear enrollment context and cancel any timeouts armed for it"""
+        self.cancel_all_enrollment_timeouts()
+        self.enrollment_context = EnrollmentContext()
         LOG.debug("Enrollment context cleared")
 
     def handle_enrollment_response(self, message):
         """Handle response from voice identification plugin"""
-        LOG.info(f"Received enrollment response: {message.data}")
+        LOG.info("Received enrollment response: %s", message.data)
 
         response_data = message.data
         status = response_data.get("status", "error")
@@ -1435,21 +1506,24 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         enrollment_id = response_data.get("enrollment_id")
 
         # Verify this response is for our current enrollment (if enrollment_id is available)
-        current_enrollment_id = self.enrollment_context.get("enrollment_id")
+        context = self.enrollment_context
+        current_enrollment_id = context.enrollment_id
         if (
             enrollment_id
             and current_enrollment_id
             and enrollment_id != current_enrollment_id
         ):
-            LOG.debug(f"Received response for different enrollment: {enrollment_id}")
+            LOG.debug("Received response for different enrollment: %s", enrollment_id)
             return
 
+        self.cancel_enrollment_timeout("processing")
+
         if status == "success":
-            self.enrollment_context["state"] = EnrollmentState.COMPLETED
+            context.state = EnrollmentState.COMPLETED
             samples_processed = response_data.get("samples_processed", 0)
 
             # Only speak if bus is available
-            if hasattr(self, "_bus") and self._bus is not None:
+            if self._bus_ready:
                 self.speak_dialog(
                     "enrollment_success",
                     {
@@ -1460,85 +1534,89 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
                 )
 
             self.reset_enrollment_context()
-            LOG.info(f"Enrollment completed successfully for {user_id}")
+            LOG.info("Enrollment completed successfully for %s", user_id)
         else:
             # Handle error response
             error_message = response_data.get("message", "Unknown error")
 
             # Map plugin error messages to our error codes
-            if (
-                "User ID is required" in error_message
-                or "missing user_name" in error_message
-            ):
-                error_code = ErrorCodes.INVALID_NAME
-            elif (
-                "Audio samples are required" in error_message
-                or "No valid audio samples" in error_message
-            ):
-                error_code = ErrorCodes.SAMPLE_COUNT_INSUFFICIENT
-            elif "Voice processor not initialized" in error_message:
-                error_code = ErrorCodes.PLUGIN_UNAVAILABLE
-            else:
-                error_code = ErrorCodes.PROCESSING_FAILED
+            match = _PLUGIN_ERROR_RE.search(error_message)
+            error_code = (
+                _PLUGIN_ERROR_CODES[match.lastindex - 1]
+                if match
+                else ErrorCodes.PROCESSING_FAILED
+            )
 
             self.handle_enrollment_failed(error_code, error_message)
 
     def handle_users_response(self, message):
         """Handle response from voice identification plugin for user listing"""
-        LOG.info(f"Received users response: {message.data}")
+        LOG.info("Received users response: %s", message.data)
 
         response_data = message.data
         status = response_data.get("status", "error")  # Plugin uses 'status' field
 
         if status == "success":
             users = response_data.get("users", [])
-            total_users = response_data.get("total_users", len(users))
+            count = len(users)
+            total_users = response_data.get("total_users", count)
             model_info = response_data.get("model_info", {})
 
-            LOG.info(f"Voice ID plugin has {total_users} enrolled users: {users}")
+            LOG.info("Voice ID plugin has %s enrolled users: %s", total_users, users)
+
+            # Store for potential skill use before handing off to TTS
+            self.enrollment_context.enrolled_users = users
+            self.enrollment_context.model_info = model_info
+
+            # Publish the listing so other skills can subscribe instead of polling
+            self._emit(
+                MessageBusEvents.USERS_UPDATED,
+                {
+                    "users": users,
+                    "count": count,
+                    "total_users": total_users,
+                    "model_info": model_info,
+                },
+            )
 
             # Speak the results to the user
-            if hasattr(self, "_bus") and self._bus is not None:
-                if total_users == 0:
+            if self._bus_ready:
+                # Branch on the list itself; the plugin's total_users may disagree
+                if count == 0:
                     self.speak_dialog("no_enrolled_users")
-                elif total_users == 1:
+                elif count == 1:
                     self.speak_dialog("one_enrolled_user", {"name": users[0]})
+                elif count <= 3:
+                    # For a few users, speak count and all names: "A and B", "A, B and C"
+                    users_list = f"{', '.join(users[:-1])} and {users[-1]}"
+                    self.speak_dialog(
+                        "multiple_enrolled_users",
+                        {"count": count, "users": users_list},
+                    )
                 else:
-                    # For multiple users, speak count and first few names
-                    if total_users <= 3:
-                        users_list = ", ".join(users[:-1]) + f" and {users[-1]}"
-                        self.speak_dialog(
-                            "multiple_enrolled_users",
-                            {"count": total_users, "users": users_list},
-                        )
-                    else:
-                        # Too many to list all, just give count
-                        self.speak_dialog("many_enrolled_users", {"count": total_users})
-
-            # Store for potential skill use
-            self.enrollment_context["enrolled_users"] = users
-            self.enrollment_context["model_info"] = model_info
+                    # Too many to list all, just give count
+                    self.speak_dialog("many_enrolled_users", {"count": count})
         else:
             # Handle error response
             error_message = response_data.get("message", "User listing failed")
-            LOG.warning(f"Failed to get enrolled users: {status} - {error_message}")
+            LOG.warning("Failed to get enrolled users: %s - %s", status, error_message)
 
-            if hasattr(self, "_bus") and self._bus is not None:
+            if self._bus_ready:
                 self.speak_dialog("error_checking_users")
 
     def handle_sample_collected(self, message):
         """Handle notification from VoiceID plugin that a sample has been collected"""
-        LOG.info(f"Received sample collected notification: {message.data}")
+        LOG.info("Received sample collected notification: %s", message.data)
 
         sample_data = message.data
         sample_id = sample_data.get("sample_id")
         quality_ok = sample_data.get("quality_ok", True)
 
         # Verify this is for our current enrollment session
-        current_recording = self.enrollment_context.get("current_recording", {})
+        current_recording = self.enrollment_context.current_recording or {}
         if current_recording.get("sample_id") != sample_id:
             LOG.warning(
-                f"Received sample notification for unknown sample_id: {sample_id}"
+                "Received sample notification for unknown sample_id: %s", sample_id
             )
             return
 
@@ -1551,63 +1629,52 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             self.speak_dialog("sample_quality_poor")
             self.retry_current_sample()
 
-    def handle_processing_timeout(self, message):
+    def handle_processing_timeout(self, message=None):
         """Handle processing timeout"""
-        enrollment_id = message.data.get("enrollment_id")
-        current_state = self.enrollment_context.get("state")
+        context = self.enrollment_context
 
-        if current_state == EnrollmentState.PROCESSING:
-            LOG.warning(f"Processing timeout for enrollment {enrollment_id}")
+        if context.state == EnrollmentState.PROCESSING:
+            LOG.warning("Processing timeout for enrollment %s", context.enrollment_id)
             self.handle_enrollment_failed(
                 ErrorCodes.PROCESSING_FAILED, "Processing timeout"
             )
 
     def handle_enrollment_failed(self, error_code: str, error_message: str):
         """Handle enrollment failure"""
-        LOG.error(f"Enrollment failed: {error_code} - {error_message}")
+        LOG.error("Enrollment failed: %s - %s", error_code, error_message)
 
-        self.enrollment_context["state"] = EnrollmentState.FAILED
-        self.enrollment_context["error_code"] = error_code
-        self.enrollment_context["error_message"] = error_message
+        context = self.enrollment_context
+        context.state = EnrollmentState.FAILED
+        context.error_code = error_code
+        context.error_message = error_message
 
         # Only speak if bus is available
-        if hasattr(self, "_bus") and self._bus is not None:
-            # Speak appropriate error message
-            if error_code == ErrorCodes.AUDIO_QUALITY_POOR:
-                self.speak_dialog("error_audio_quality")
-            elif error_code == ErrorCodes.PROCESSING_FAILED:
-                self.speak_dialog("error_processing_failed")
-            elif error_code == ErrorCodes.NETWORK_ERROR:
-                self.speak_dialog("error_network")
-            elif error_code == ErrorCodes.PLUGIN_UNAVAILABLE:
-                self.speak_dialog("error_plugin_unavailable")
-            elif error_code == ErrorCodes.USER_EXISTS:
-                self.speak_dialog("error_user_exists")
-            else:
-                self.speak_dialog("error_general")
-
-            # Ask if user wants to try again
-            self.speak_dialog("ask_try_again")
+        if self._bus_ready:
+            # Speak appropriate error message and ask if user wants to try again
+            self._speak_dialogs(
+                _ERROR_DIALOGS.get(error_code, "error_general"), "ask_try_again"
+            )
             self.set_context("AwaitingRetryEnrollment")
 
     @intent_handler(
-        IntentBuilder("TryAgainYes")
-        .require("YesKeyword")
+        IntentBuilder("TryAgainResponse")
+        .one_of("YesKeyword", "NoKeyword")
         .require("AwaitingRetryEnrollment")
         .build()
     )
+    def handle_try_again_response(self, message):
+        """Route yes/no answers to the try-again prompt"""
+        if message.data.get("YesKeyword"):
+            self.handle_try_again_yes(message)
+        else:
+            self.handle_try_again_no(message)
+
     def handle_try_again_yes(self, message):
         """Handle try again confirmation - yes"""
         self.remove_context("AwaitingRetryEnrollment")
-        user_name = self.enrollment_context.get("user_name")
+        user_name = self.enrollment_context.user_name
         self.start_enrollment_flow(user_name, trigger="retry")
 
-    @intent_handler(
-        IntentBuilder("TryAgainNo")
-        .require("NoKeyword")
-        .require("AwaitingRetryEnrollment")
-        .build()
-    )
     def handle_try_again_no(self, message):
         """Handle try again confirmation - no"""
         self.remove_context("AwaitingRetryEnrollment")
@@ -1616,7 +1683,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
 
     def converse(self, message=None):
         """Handle conversational context during enrollment - intercept global stops"""
-        if not self.enrollment_context or self.get_enrollment_state() == "idle":
+        if self.get_enrollment_state() == "idle":
             return False  # Not in enrollment, let other skills handle
 
         utterance = (
@@ -1625,44 +1692,9 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             else ""
         )
 
-        # Check for global abort/stop intents during enrollment
-        abort_patterns = [
-            "stop",
-            "cancel",
-            "quit",
-            "abort",
-            "exit",
-            "nevermind",
-            "never mind",
-            "forget it",
-            "not now",
-            "end this",
-            "stop enrollment",
-            "cancel enrollment",
-        ]
-
         # Check for restart/change name requests during enrollment
-        restart_patterns = [
-            "restart",
-            "start over",
-            "start again",
-            "begin again",
-            "restart enrollment",
-            "change name",
-            "different name",
-            "wrong name",
-            "use different name",
-            "that's wrong",
-            "that's not right",
-            "not that name",
-            "enroll as",
-            "i want to restart",
-            "let me restart",
-            "can i restart",
-        ]
-
-        if any(pattern in utterance for pattern in restart_patterns):
-            LOG.info(f"User requested enrollment restart: {utterance}")
+        if _SESSION_RESTART_RE.search(utterance):
+            LOG.info("User requested enrollment restart: %s", utterance)
 
             # Extract new name if provided
             new_name = self.extract_user_name_from_utterance(utterance)
@@ -1672,15 +1704,16 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
 
             # Start fresh enrollment
             if new_name:
-                LOG.info(f"Restarting enrollment with new name: {new_name}")
+                LOG.info("Restarting enrollment with new name: %s", new_name)
                 self.start_enrollment_flow(new_name, trigger="restart_with_name")
             else:
                 self.speak_dialog("enrollment_restarted")
                 self.start_enrollment_flow(None, trigger="restart_no_name")
             return True  # Consumed the utterance
 
-        if any(pattern in utterance for pattern in abort_patterns):
-            LOG.info(f"Global abort detected during enrollment: {utterance}")
+        # Check for global abort/stop intents during enrollment
+        if _SESSION_ABORT_RE.search(utterance):
+            LOG.info("Global abort detected during enrollment: %s", utterance)
             self.speak_dialog("enrollment_cancelled")
             self.cleanup_enrollment_session()
             return True  # Consumed the utterance
@@ -1690,28 +1723,16 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
     def cleanup_enrollment_session(self):
         """Clean up enrollment session and notify plugin"""
         # Notify plugin to stop any ongoing sample collection
-        if self.enrollment_context.get("current_recording"):
+        if self.enrollment_context.current_recording:
             self.stop_current_recording()
 
         # Notify plugin of session termination
-        if hasattr(self, "_bus") and self._bus is not None:
-            self.bus.emit(
-                Message(
-                    MessageBusEvents.SESSION_EXPIRED,
-                    {
-                        "session_id": self.enrollment_context.get("session_id"),
-                        "user_name": self.enrollment_context.get("user_name"),
-                        "reason": "user_abort",
-                    },
-                )
-            )
+        self._emit_session_expired(reason="user_abort")
 
-        self.cancel_all_enrollment_timeouts()
         self.clear_enrollment_context()
 
     def stop(self):
         """Clean up when skill stops"""
-        self.cancel_all_enrollment_timeouts()
         self.clear_enrollment_context()
 
     # ==========================================
@@ -1723,23 +1744,36 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         # Cancel existing timer of this type
         self.cancel_enrollment_timeout(timeout_type)
 
-        # Set new timer
-        timer_id = self.schedule_event(callback, duration)
-        self.active_timers[timeout_type] = timer_id
+        def on_timeout(message=None):
+            # A fired timeout is no longer pending, so resets need not cancel it
+            self.active_timers.pop(timeout_type, None)
+            callback(message)
+
+        # Set new timer; schedule_event returns nothing, so events are
+        # cancelled through the name they were scheduled under
+        event_name = f"enrollment_timeout_{timeout_type}"
+        self.schedule_event(on_timeout, duration, name=event_name)
+        self.active_timers[timeout_type] = event_name
 
-        LOG.debug(f"Set {timeout_type} timeout for {duration} seconds")
+        LOG.debug("Set %s timeout for %s seconds", timeout_type, duration)
 
     def cancel_enrollment_timeout(self, timeout_type: str):
         """Cancel a specific timeout"""
-        if timeout_type in self.active_timers:
-            timer_id = self.active_timers.pop(timeout_type)
-            self.cancel_scheduled_event(timer_id)
-            LOG.debug(f"Cancelled {timeout_type} timeout")
+        event_name = self.active_timers.pop(timeout_type, None)
+        if event_name is not None:
+            self.cancel_scheduled_event(event_name)
+            LOG.debug("Cancelled %s timeout", timeout_type)
 
     def cancel_all_enrollment_timeouts(self):
         """Cancel all active enrollment timeouts"""
-        for timeout_type in list(self.active_timers.keys()):
-            self.cancel_enrollment_timeout(timeout_type)
+        if not self.active_timers:
+            return
+
+        # Drain the registry directly rather than copying its keys and
+        # re-checking each one through cancel_enrollment_timeout
+        while self.active_timers:
+            _, event_name = self.active_timers.popitem()
+            self.cancel_scheduled_event(event_name)
         LOG.debug("Cancelled all enrollment timeouts")
 
     # ==========================================
@@ -1748,14 +1782,16 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
 
     def handle_confirmation_timeout(self, message=None):
         """Handle timeout when waiting for user confirmation"""
-        retry_count = self.enrollment_context.get("confirmation_retry_count", 0)
+        retry_count = self.enrollment_context.confirmation_retry_count
 
         if retry_count < 2:  # Allow 2 retries
             self.speak_dialog("enrollment_timeout_confirmation")
             # "I didn't hear a response. Would you like to enroll your voice? Say yes or no."
-            self.enrollment_context["confirmation_retry_count"] = retry_count + 1
+            self.enrollment_context.confirmation_retry_count = retry_count + 1
             self.set_enrollment_timeout(
-                "confirmation", 30, self.handle_confirmation_timeout
+                "confirmation",
+                EnrollmentTimeouts.CONFIRMATION,
+                self.handle_confirmation_timeout,
             )
         else:
             self.speak_dialog("enrollment_cancelled_timeout")
@@ -1764,15 +1800,17 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
 
     def handle_name_collection_timeout(self, message=None):
         """Handle timeout when waiting for third-person name"""
-        retry_count = self.enrollment_context.get("name_collection_retry_count", 0)
+        retry_count = self.enrollment_context.name_collection_retry_count
 
         if retry_count < 2:  # Allow 2 retries
-            relationship = self.enrollment_context.get("relationship", "someone else")
+            relationship = self.enrollment_context.relationship or "someone else"
             self.speak_dialog("ask_try_again")
             self.speak_dialog("third_person_enrollment", {"relationship": relationship})
-            self.enrollment_context["name_collection_retry_count"] = retry_count + 1
+            self.enrollment_context.name_collection_retry_count = retry_count + 1
             self.set_enrollment_timeout(
-                "name_collection", 30, self.handle_name_collection_timeout
+                "name_collection",
+                EnrollmentTimeouts.NAME_COLLECTION,
+                self.handle_name_collection_timeout,
             )
         else:
             self.speak_dialog("enrollment_cancelled")
@@ -1780,8 +1818,8 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
 
     def handle_sample_timeout(self, message=None):
         """Handle timeout during sample collection"""
-        sample_retry_count = self.enrollment_context.get("sample_retry_count", 0)
-        current_phrase = self.enrollment_context.get("current_phrase", "")
+        sample_retry_count = self.enrollment_context.sample_retry_count
+        current_phrase = self.enrollment_context.current_phrase
 
         if sample_retry_count < 2:  # Allow 2 retries per sample
             if sample_retry_count == 0:
@@ -1789,32 +1827,28 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             else:
                 self.speak_dialog("sample_timeout_second", {"phrase": current_phrase})
 
-            self.enrollment_context["sample_retry_count"] = sample_retry_count + 1
+            self.enrollment_context.sample_retry_count = sample_retry_count + 1
             self.restart_current_sample()
         else:
             # Ask for confirmation before skipping/aborting
             self.speak_dialog("sample_timeout_confirm_abort")
             # "Having trouble with that sample. Should I continue with enrollment or abort? Say continue or abort."
-            self.set_context("AwaitingTimeoutConfirmation")
-            self.enrollment_context["timeout_type"] = "sample_final"
-            timeout_duration = self.enrollment_timeouts.get("retry_confirmation", 30)
-            self.set_enrollment_timeout(
-                "timeout_confirmation",
-                timeout_duration,
-                self.handle_timeout_confirmation_timeout,
-            )
+            self._await_timeout_confirmation("sample_final")
 
     def handle_session_timeout(self, message=None):
         """Handle overall enrollment session timeout"""
         # Ask for confirmation before expiring the session
         self.speak_dialog("session_timeout_confirm_abort")
         # "Your enrollment session is about to expire. Should I continue or abort enrollment? Say continue or abort."
+        self._await_timeout_confirmation("session_final")
+
+    def _await_timeout_confirmation(self, timeout_type: str):
+        """Wait for a continue/abort answer after a sample or session timeout"""
         self.set_context("AwaitingTimeoutConfirmation")
-        self.enrollment_context["timeout_type"] = "session_final"
-        timeout_duration = self.enrollment_timeouts.get("retry_confirmation", 30)
+        self.enrollment_context.timeout_type = timeout_type
         self.set_enrollment_timeout(
             "timeout_confirmation",
-            timeout_duration,
+            EnrollmentTimeouts.RETRY_CONFIRMATION,
             self.handle_timeout_confirmation_timeout,
         )
 
@@ -1827,7 +1861,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
     def handle_timeout_confirmation_timeout(self, message=None):
         """Handle timeout when user doesn't respond to abort/continue confirmation"""
         # If no response to abort/continue, treat as abort
-        timeout_type = self.enrollment_context.get("timeout_type", "")
+        timeout_type = self.enrollment_context.timeout_type
         self.remove_context("AwaitingTimeoutConfirmation")
 
         if timeout_type == "sample_final":
@@ -1837,16 +1871,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             self.speak_dialog("enrollment_session_expired")
             # "Session expired. Enrollment cancelled."
             # Notify plugin to clean up
-            if hasattr(self, "_bus") and self._bus is not None:
-                self.bus.emit(
-                    Message(
-                        MessageBusEvents.SESSION_EXPIRED,
-                        {
-                            "session_id": self.enrollment_context.get("session_id"),
-                            "user_name": self.enrollment_context.get("user_name"),
-                        },
-                    )
-                )
+            self._emit_session_expired()
 
         self.reset_enrollment_context()
 
@@ -1856,24 +1881,25 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
 
     def restart_current_sample(self):
         """Restart collection of current sample after timeout"""
-        current_phrase = self.enrollment_context.get("current_phrase", "")
+        current_phrase = self.enrollment_context.current_phrase
         if current_phrase:
             # Restart sample collection with same phrase
             self.set_enrollment_timeout(
                 "sample_collection",
-                self.enrollment_timeouts["sample_collection"],
+                EnrollmentTimeouts.SAMPLE_COLLECTION,
                 self.handle_sample_timeout,
             )
-            LOG.debug(f"Restarted sample collection for phrase: {current_phrase}")
+            LOG.debug("Restarted sample collection for phrase: %s", current_phrase)
         else:
             # Fallback to normal sample collection flow
             self.start_sample_collection()
 
     def skip_to_next_sample_or_complete(self):
         """Skip current sample and move to next or complete enrollment"""
-        current_sample = self.enrollment_context.get("current_sample_index", 0)
-        target_samples = self.enrollment_context.get("target_samples", 3)
-        collected_samples = len(self.enrollment_context.get("samples", []))
+        context = self.enrollment_context
+        current_sample = context.current_sample_index
+        target_samples = context.target_samples
+        collected_samples = len(context.samples)
 
         if collected_samples >= 2:  # Have at least 2 samples, can complete
             self.speak_dialog("enrollment_completing_partial")
@@ -1881,8 +1907,8 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
             self.finish_sample_collection()
         elif current_sample + 1 < target_samples:
             # Move to next sample
-            self.enrollment_context["current_sample_index"] = current_sample + 1
-            self.enrollment_context["sample_retry_count"] = 0  # Reset retry count
+            context.current_sample_index = current_sample + 1
+            context.sample_retry_count = 0  # Reset retry count
             self.start_sample_collection()
         else:
             # No more samples and insufficient collected
@@ -1895,7 +1921,11 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         self.speak_dialog("ask_try_again")
         # "Would you like to try enrolling your voice again? Say yes or no."
         self.set_context("AwaitingRetryConfirmation")
-        self.set_enrollment_timeout("retry_confirmation", 30, self.handle_retry_timeout)
+        self.set_enrollment_timeout(
+            "retry_confirmation",
+            EnrollmentTimeouts.RETRY_CONFIRMATION,
+            self.handle_retry_timeout,
+        )
 
     def pause_enrollment(self):
         """Pause enrollment for user to resume later"""
@@ -1903,12 +1933,14 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
         # "Enrollment paused. Say 'continue enrollment' or 'enroll my voice' to resume."
 
         # Store partial progress
-        self.enrollment_context["state"] = "paused"
-        self.enrollment_context["paused_at"] = datetime.now().isoformat()
+        self.enrollment_context.state = "paused"
+        self.enrollment_context.paused_at = datetime.now().isoformat()
 
         # Set long-term timeout for paused state (1 hour)
         self.set_enrollment_timeout(
-            "paused_session", 3600, self.expire_paused_enrollment
+            "paused_session",
+            EnrollmentTimeouts.PAUSED_SESSION,
+            self.expire_paused_enrollment,
         )
 
     def expire_paused_enrollment(self, message=None):
@@ -1920,7 +1952,7 @@ class OMVAVoiceEnrollmentSkill(OVOSSkill):
     def reset_enrollment_context(self):
         """Reset enrollment context and cancel all timeouts"""
         self.cancel_all_enrollment_timeouts()
-        self.clear_enrollment_context()
+        self.enrollment_context = EnrollmentContext()
         LOG.info("Enrollment context reset due to timeout or cancellation")
 
     def shutdown(self):
@@ -11,6 +11,7 @@ DEFAULT_TARGET_SAMPLES = 3
 MIN_AUDIO_DURATION = 3.0
 MAX_AUDIO_DURATION = 10.0
 DEFAULT_QUALITY_THRESHOLD = 0.7
+DEFAULT_INTER_SAMPLE_PAUSE = 0.5  # Seconds before prompting for the next sample
 
 # Name validation settings
 MIN_NAME_LENGTH = 2
@@ -58,6 +59,21 @@ class MessageBusEvents:
     VOICE_IDENTIFIED = "ovos.voice.identified"
     VOICE_UNKNOWN = "ovos.voice.unknown"
 
+    # Skill-originated events (for other skills)
+    USERS_UPDATED = "omva.enrollment.users_updated"
+
+
+# Enrollment timeouts (seconds)
+class EnrollmentTimeouts:
+    CONFIRMATION = 30  # Wait for user confirmation
+    SAMPLE_COLLECTION = 15  # Wait for each sample
+    BETWEEN_SAMPLES = 10  # Wait between samples
+    OVERALL_SESSION = 600  # Total enrollment session (10 minutes)
+    PROCESSING = 30  # Wait for plugin processing
+    RETRY_CONFIRMATION = 30  # Wait for retry confirmation
+    NAME_COLLECTION = 30  # Wait for third-person name collection
+    PAUSED_SESSION = 3600  # Keep a paused session resumable (1 hour)
+
 
 # Audio quality thresholds
 class AudioQuality:
@@ -68,7 +84,7 @@ class AudioQuality:
 
 
 # Sample collection phrases for voice training
-SAMPLE_PHRASES = [
+SAMPLE_PHRASES = (
     "The quick brown fox jumps over the lazy dog",
     "She sells seashells by the seashore",
     "How much wood would a woodchuck chuck if a woodchuck could chuck wood",
@@ -79,7 +95,7 @@ SAMPLE_PHRASES = [
     "Unique New York, unique New York",
     "Sally sells seashells down by the seashore",
     "The thirty-three thieves thought that they thrilled the throne throughout Thursday",
-]
+)
 
 
 # Intent confidence thresholds
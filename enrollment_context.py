@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Enrollment session context for OMVA Voice Enrollment Skill
+
+Copyright 2024 OMVA Team
+Licensed under the Apache License, Version 2.0
+"""
+
+from typing import Any, Dict, List, Optional
+
+try:
+    # Try relative import first (when used as a package)
+    from .constants import DEFAULT_TARGET_SAMPLES, EnrollmentState
+except ImportError:
+    # Fall back to absolute import (when run directly or in tests)
+    from constants import DEFAULT_TARGET_SAMPLES, EnrollmentState
+
+
+class EnrollmentContext:
+    """
+    State of the current enrollment session
+
+    Uses __slots__ so every state read is a fixed attribute load rather than
+    a dict lookup, and a misspelled field fails loudly instead of silently
+    returning a default.
+    """
+
+    __slots__ = (
+        "state",
+        "user_name",
+        "trigger",
+        "session_id",
+        "started_at",
+        "target_samples",
+        "samples_collected",
+        "third_person",
+        "relationship",
+        "samples",
+        "current_sample_index",
+        "current_phrase",
+        "current_recording",
+        "enrollment_id",
+        "enrolled_users",
+        "model_info",
+        "error_code",
+        "error_message",
+        "confirmation_retry_count",
+        "name_collection_retry_count",
+        "sample_retry_count",
+        "timeout_type",
+        "paused_at",
+    )
+
+    def __init__(self):
+        # Session identity
+        self.state: str = EnrollmentState.IDLE
+        self.user_name: Optional[str] = None
+        self.trigger: Optional[str] = None
+        self.session_id: Optional[str] = None
+        self.started_at: Optional[str] = None
+
+        # Third-person enrollment
+        self.third_person: bool = False
+        self.relationship: Optional[str] = None
+
+        # Sample collection progress
+        self.target_samples: int = DEFAULT_TARGET_SAMPLES
+        self.samples_collected: int = 0
+        self.samples: List[Dict[str, Any]] = []
+        self.current_sample_index: int = 0
+        self.current_phrase: str = ""
+        self.current_recording: Optional[Dict[str, Any]] = None
+
+        # Processing results
+        self.enrollment_id: Optional[str] = None
+        self.enrolled_users: List[str] = []
+        self.model_info: Dict[str, Any] = {}
+        self.error_code: Optional[str] = None
+        self.error_message: Optional[str] = None
+
+        # Timeout and retry tracking
+        self.confirmation_retry_count: int = 0
+        self.name_collection_retry_count: int = 0
+        self.sample_retry_count: int = 0
+        self.timeout_type: str = ""
+        self.paused_at: Optional[str] = None
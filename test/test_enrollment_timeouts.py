@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Enrollment timeout tests for OMVA Voice Enrollment Skill
+
+Copyright 2024 OMVA Team
+Licensed under the Apache License, Version 2.0
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from test_name_extraction import skill_module
+
+
+class TestEnrollmentTimeouts(unittest.TestCase):
+    """Timeouts armed for a session are cancelled when it ends"""
+
+    def setUp(self):
+        self.skill = skill_module.OMVAVoiceEnrollmentSkill()
+        self.skill.schedule_event = MagicMock()
+        self.skill.cancel_scheduled_event = MagicMock()
+        self.skill.remove_context = MagicMock()
+        self.skill.speak_dialog = MagicMock()
+
+    def arm(self, *timeout_types):
+        for timeout_type in timeout_types:
+            self.skill.set_enrollment_timeout(timeout_type, 30, lambda _: None)
+
+    def cancelled(self):
+        return {c.args[0] for c in self.skill.cancel_scheduled_event.call_args_list}
+
+    def test_confirm_yes_cancels_confirmation_timeout(self):
+        self.skill.proceed_with_enrollment = MagicMock()
+        self.arm("overall_session", "confirmation")
+        self.skill.handle_confirm_enrollment_yes(None)
+        self.assertIn("enrollment_timeout_confirmation", self.cancelled())
+        self.assertEqual(list(self.skill.active_timers), ["overall_session"])
+
+    def test_try_again_no_cancels_all_timeouts(self):
+        self.arm("overall_session", "confirmation")
+        self.skill.handle_try_again_no(None)
+        self.assertEqual(
+            self.cancelled(),
+            {"enrollment_timeout_overall_session", "enrollment_timeout_confirmation"},
+        )
+        self.assertEqual(self.skill.active_timers, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Name extraction tests for OMVA Voice Enrollment Skill
+
+Copyright 2024 OMVA Team
+Licensed under the Apache License, Version 2.0
+"""
+
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+
+
+def load_skill_module():
+    """Import the skill package from the repository root"""
+    spec = importlib.util.spec_from_file_location(
+        "omva_skill_voice_enrollment",
+        SKILL_DIR / "__init__.py",
+        submodule_search_locations=[str(SKILL_DIR)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+skill_module = load_skill_module()
+
+
+class TestLocaleNameExtraction(unittest.TestCase):
+    """Names extracted through the en-us locale patterns"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.skill = skill_module.OMVAVoiceEnrollmentSkill()
+        cls.skill.locale_patterns = cls.skill._read_locale_patterns(
+            str(SKILL_DIR / "locale/en-us/patterns/name_extraction.patterns")
+        )
+        cls.skill._rebuild_patterns()
+
+    def setUp(self):
+        self.skill.reset_enrollment_context()
+
+    def assert_name(self, utterance, expected):
+        self.assertEqual(
+            self.skill.extract_user_name_from_utterance(utterance), expected
+        )
+
+    def test_preposition_wins_over_earlier_intro(self):
+        self.assert_name("I'm enrolling for Bob", "Bob")
+        self.assert_name("I am enrolling my voice as John", "John")
+        self.assert_name("i am going to enroll as Sue", "Sue")
+        self.assert_name("hi this is for Anna", "Anna")
+
+    def test_intro_stops_before_enrollment_verb(self):
+        self.assert_name("this is John enroll my voice", "John")
+
+    def test_plain_intro_and_preposition(self):
+        self.assert_name("my name is Mary Smith", "Mary Smith")
+        self.assert_name("call me Dr. Who", "Dr. Who")
+        self.assert_name("register my voice for Mary Smith", "Mary Smith")
+
+
+if __name__ == "__main__":
+    unittest.main()